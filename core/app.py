@@ -0,0 +1,360 @@
+import asyncio
+import atexit
+import logging
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, MemoryHandler
+from threading import Lock
+from typing import Dict, Optional, TYPE_CHECKING
+
+from PySide6.QtCore import Qt, QTimer
+
+from core.service.event_loop_thread import AsyncEventLoopThread
+from core.service.polling_service import PollingService
+from infrastructure.config.config import settings, LOG_LEVEL_INT
+from infrastructure.db.postgres import PostgresDB
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
+    from ui.main_window import MeteoMonitor
+
+# Формат логов не использует поток, процесс и место вызова - не собираем их для каждой записи
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None  # Отключает поиск вызывающего кадра стека (findCaller)
+
+SHUTDOWN_TIMEOUT = 5.0  # Сколько ждать завершения опроса при выходе, сек
+SHUTDOWN_CHECK_INTERVAL_MS = 100  # Период проверки завершения опроса
+LOG_FILE_BUFFER_CAPACITY = 1024  # Записей, накапливаемых перед записью в файл лога
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Форматтер, пересчитывающий строку времени не чаще раза в секунду"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (-1, "")  # (секунда, отформатированное время)
+
+    def formatTime(self, record, datefmt=None):
+        if not datefmt:
+            return super().formatTime(record, datefmt)  # Формат по умолчанию содержит миллисекунды
+
+        second = int(record.created)
+        cached_second, cached_str = self._cached_time
+        if second != cached_second:
+            cached_str = super().formatTime(record, datefmt)
+            self._cached_time = (second, cached_str)
+        return cached_str
+
+
+class Application:
+    def __init__(self):
+        """Инициализация приложения"""
+        self.logger = logging.getLogger("App")
+        self.db: Optional[PostgresDB] = None
+        self.polling_service: Optional[PollingService] = None
+        self.gui: Optional["MeteoMonitor"] = None
+        self.app: Optional["QApplication"] = None  # Создается в initialize_gui
+        self._loop_thread: Optional[AsyncEventLoopThread] = None
+        self._polling_task: Optional[asyncio.Task] = None  # Используется только в потоке опроса
+        self._polling_lock = Lock()
+        self._is_polling_active = False
+        self._log_handlers: Dict[str, logging.Handler] = {}  # Обработчики вывода по назначению
+        self._log_formatter = CachedTimeFormatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+        self._log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._log_listener: Optional[QueueListener] = None
+        self._shutdown_timer: Optional[QTimer] = None
+        self._shutdown_deadline = 0.0
+
+        # Настраиваем логирование
+        self.setup_logging(include_gui_handler=False)
+
+        self.logger.info("Приложение инициализировано")
+
+    def setup_logging(self, include_gui_handler=True):
+        """Настройка системы логирования (каждый обработчик создается один раз)"""
+        handlers_changed = False
+
+        if not self._log_handlers:
+            # Настраиваем корневой логгер: записи только ставятся в очередь,
+            # форматирование и вывод выполняет фоновый поток QueueListener
+            root_logger = logging.getLogger()
+            root_logger.handlers = []
+            root_logger.setLevel(LOG_LEVEL_INT)
+            root_logger.addHandler(QueueHandler(self._log_queue))
+            # Записи из очереди выводятся и при аварийном завершении процесса
+            atexit.register(self.stop_logging)
+
+            # Консольный обработчик
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(self._log_formatter)
+
+            # Файловый обработчик с ротацией; записи копятся в памяти и пишутся в файл пачками,
+            # предупреждения и ошибки записываются сразу вместе с накопленным
+            raw_file_handler = RotatingFileHandler(
+                settings.LOG_FILE,
+                maxBytes=settings.LOG_MAX_BYTES,
+                backupCount=settings.LOG_BACKUP_COUNT,
+                encoding="utf-8",
+                delay=True
+            )
+            raw_file_handler.setFormatter(self._log_formatter)
+
+            self._log_handlers["console"] = console_handler
+            self._log_handlers["file"] = MemoryHandler(
+                LOG_FILE_BUFFER_CAPACITY,
+                flushLevel=logging.WARNING,
+                target=raw_file_handler,
+                flushOnClose=True
+            )
+            handlers_changed = True
+
+        # GUI обработчик добавляем только после инициализации GUI
+        if include_gui_handler and self.gui and "gui" not in self._log_handlers:
+            from ui.main_window import GUILogHandler
+
+            gui_handler = GUILogHandler(self.gui.log_buffer)
+            gui_handler.setFormatter(self._log_formatter)
+            self._log_handlers["gui"] = gui_handler
+            handlers_changed = True
+
+        if handlers_changed:
+            self._restart_log_listener(list(self._log_handlers.values()))
+
+    def _restart_log_listener(self, handlers):
+        """Запуск фонового потока вывода логов с заданным набором обработчиков"""
+        if self._log_listener is not None:
+            self._log_listener.stop()  # Дописывает накопленные в очереди записи
+        self._log_listener = QueueListener(self._log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+
+    def stop_logging(self):
+        """Остановка фонового потока вывода логов с выводом оставшихся записей"""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+        file_handler = self._log_handlers.get("file")
+        if file_handler is not None and file_handler.target is not None:
+            # Сбрасываем накопленные записи в файл и закрываем его
+            target = file_handler.target
+            file_handler.close()  # Сбрасывает буфер и отсоединяет target
+            target.close()
+
+    def initialize_db(self) -> bool:
+        """Инициализация подключения к базе данных"""
+        try:
+            self.db = PostgresDB(
+                settings.DATABASE_URL,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW
+            )
+            if not self.db.check_connection():
+                raise ConnectionError("Не удалось подключиться к БД")
+
+            self.db.init_db()
+            self.logger.info("База данных инициализирована")
+            return True
+        except Exception as e:
+            self.logger.critical("Ошибка инициализации БД: %s", e)
+            return False
+
+    def initialize_polling_service(self) -> bool:
+        """Инициализация сервиса опроса"""
+        try:
+            if self.db is None:
+                raise ValueError("База данных не инициализирована")
+
+            self.polling_service = PollingService(
+                self.db,
+                snapshot_every=settings.SNAPSHOT_EVERY,
+                history_max_bytes=settings.HISTORY_MAX_BYTES,
+                history_backup_count=settings.HISTORY_BACKUP_COUNT,
+                max_concurrent_polls=settings.MAX_CONCURRENT_POLLS,
+                stream_frames=settings.STREAM_FRAMES
+            )
+
+            # Соединяем сигнал с методом GUI
+            if self.gui:
+                self._connect_gui_signals()
+
+            self.logger.info("Сервис опроса инициализирован")
+            return True
+        except Exception as e:
+            self.logger.error("Ошибка инициализации сервиса опроса: %s", e)
+            return False
+
+    def run_polling_service(self):
+        """Запуск сервиса опроса в отдельном потоке"""
+        with self._polling_lock:
+            if self.polling_service is None:
+                self.logger.error("Сервис опроса не инициализирован")
+                return
+
+            if self._is_polling_active:
+                self.logger.warning("Сервис опроса уже запущен")
+                return
+
+            try:
+                # Поток с циклом событий создается один раз и переиспользуется при перезапуске опроса
+                if self._loop_thread is None:
+                    self._loop_thread = AsyncEventLoopThread(
+                        executor_workers=settings.THREAD_POOL_SIZE, cpu=settings.POLLING_CPU
+                    )
+                    self._loop_thread.start()
+                self._is_polling_active = True
+                self._loop_thread.run_coroutine(self._run_polling())
+                self.logger.info("Сервис опроса запущен в отдельном потоке")
+            except Exception as e:
+                self._is_polling_active = False
+                self.logger.error("Ошибка запуска сервиса опроса: %s", e)
+
+    async def _run_polling(self):
+        """Задача опроса (выполняется в цикле событий потока опроса)"""
+        self._polling_task = asyncio.current_task()
+        try:
+            await self.polling_service.run()
+        except asyncio.CancelledError:
+            self.logger.info("Сервис опроса остановлен")
+        except Exception as e:
+            self.logger.error("Ошибка в сервисе опроса: %s", e)
+        finally:
+            self._polling_task = None
+            with self._polling_lock:
+                self._is_polling_active = False
+
+    async def _cancel_polling(self):
+        """Отмена задачи опроса (выполняется в цикле событий потока опроса)"""
+        if self._polling_task is not None:
+            self._polling_task.cancel()
+
+    def stop_polling_service(self):
+        """Запрос остановки сервиса опроса (не дожидается ее завершения)"""
+        with self._polling_lock:
+            if not self._is_polling_active or self.polling_service is None:
+                return
+
+            self.logger.info("Остановка сервиса опроса...")
+            # Выполнится в цикле опроса после запуска задачи опроса, даже если та еще не начата
+            self._loop_thread.run_coroutine(self._cancel_polling())
+
+    def initialize_gui(self):
+        """Инициализация графического интерфейса"""
+        # Модули Qt Widgets загружаются только здесь: ошибки БД при запуске выявляются без них
+        from PySide6.QtWidgets import QApplication
+        from ui.edit_window import load_edit_stylesheet
+        from ui.main_window import MeteoMonitor, MAIN_WINDOW_QSS
+
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        # Выход выполняется явно, после завершения потока опроса
+        self.app.setQuitOnLastWindowClosed(False)
+
+        try:
+            # Стили окон разбираются Qt один раз для всего приложения
+            self.app.setStyleSheet(MAIN_WINDOW_QSS + load_edit_stylesheet())
+            self.gui = MeteoMonitor(self)
+            self.gui.closeEvent = self.on_gui_close
+
+            if self.polling_service:
+                self._connect_gui_signals()
+
+            # Добавляем GUI обработчик в логирование
+            self.setup_logging(include_gui_handler=True)
+
+        except Exception as e:
+            self.logger.critical("Ошибка инициализации GUI: %s", e)
+            raise
+
+    def _connect_gui_signals(self):
+        """Подключение сигналов сервиса опроса к GUI (доставка через очередь событий Qt)"""
+        self.polling_service.all_updated.connect(
+            self.gui.update_sensors_batch, Qt.QueuedConnection
+        )
+
+    def on_gui_close(self, event):
+        """Обработчик закрытия главного окна"""
+        self.logger.info("Завершение работы приложения...")
+        self.shutdown()
+        event.accept()
+
+    def shutdown(self):
+        """Корректное завершение работы приложения"""
+        self.logger.info("Запуск процедуры завершения работы...")
+
+        # Останавливаем сервис опроса и ждем его завершения по таймеру, не блокируя GUI
+        if self.is_polling_active():
+            self.stop_polling_service()
+            self._shutdown_deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+            self._shutdown_timer = QTimer()
+            self._shutdown_timer.timeout.connect(self._check_polling_stopped)
+            self._shutdown_timer.start(SHUTDOWN_CHECK_INTERVAL_MS)
+            return
+
+        self._finish_shutdown()
+
+    def _check_polling_stopped(self):
+        """Проверка завершения опроса при выходе из приложения"""
+        polling_active = self.is_polling_active()
+        if polling_active and time.monotonic() < self._shutdown_deadline:
+            return
+
+        self._shutdown_timer.stop()
+        if polling_active:
+            self.logger.warning("Опрос не завершился в течение таймаута")
+        self._finish_shutdown()
+
+    def _finish_shutdown(self):
+        """Освобождение ресурсов и выход из цикла событий Qt"""
+        # Останавливаем цикл событий опроса (поток дожидается завершения операций записи)
+        if self._loop_thread is not None:
+            self._loop_thread.stop()
+            self._loop_thread.join(timeout=SHUTDOWN_TIMEOUT)
+            self._loop_thread = None
+
+        if self.gui is not None:
+            self.gui.shutdown_io_pool()
+
+        # Закрываем соединение с БД
+        if self.db is not None:
+            self.db.close_connection()
+            self.logger.info("Соединение с БД закрыто")
+
+        self.stop_logging()
+        if self.app is not None:
+            self.app.quit()
+
+    def run(self) -> int:
+        """Основной метод запуска приложения; возвращает код завершения процесса"""
+        self.logger.info("Запуск приложения")
+
+        if not self.initialize_db() or not self.initialize_polling_service():
+            self.stop_logging()
+            return 1
+
+        # Запускаем сервис опроса ДО инициализации GUI
+        self.run_polling_service()
+
+        # Инициализируем GUI
+        try:
+            self.initialize_gui()
+        except Exception:
+            # Ошибка уже записана в лог; опрос без окна не нужен
+            self.stop_polling_service()
+            self.stop_logging()
+            return 1
+
+        # Показываем главное окно
+        self.gui.show()
+
+        # Запускаем цикл событий; код выхода Qt становится кодом процесса
+        return self.app.exec()
+
+    def is_polling_active(self) -> bool:
+        """Проверка активности опроса"""
+        with self._polling_lock:
+            return self._is_polling_active
+
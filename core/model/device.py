@@ -17,12 +17,10 @@ class Device(Base):
 
     device_type = relationship(
         "DeviceType",
-        back_populates="devices",
-        lazy="joined"
+        back_populates="devices"
     )
     thresholds = relationship(
         "Threshold",
         back_populates="device",
-        cascade="all, delete-orphan",
-        lazy="selectin"
+        cascade="all, delete-orphan"
     )
@@ -14,13 +14,11 @@ class DeviceType(Base):
     parameters = relationship(
         "Parameter",
         back_populates="device_type",
-        cascade="all, delete-orphan",
-        lazy="selectin"
+        cascade="all, delete-orphan"
     )
     devices = relationship(
         "Device",
         back_populates="device_type",
-        cascade="all, delete-orphan",
-        lazy="selectin"
+        cascade="all, delete-orphan"
     )
 
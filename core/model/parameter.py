@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, reconstructor, validates
 
 from core.model.base import Base
 
@@ -16,12 +16,39 @@ class Parameter(Base):
 
     device_type = relationship(
         "DeviceType",
-        back_populates="parameters",
-        lazy="joined"
+        back_populates="parameters"
     )
     thresholds = relationship(
         "Threshold",
         back_populates="parameter",
-        cascade="all, delete-orphan",
-        lazy="selectin"
+        cascade="all, delete-orphan"
     )
+
+    metric_str = ""  # Единица измерения для вывода (пустая строка вместо None)
+
+    @reconstructor
+    def _init_on_load(self):
+        """Подготовка производных от команды атрибутов при загрузке из БД"""
+        self._prepare_command(self.command)
+        self.metric_str = self.metric or ""
+
+    @validates('command')
+    def _validate_command(self, key, command):
+        """Обновление производных атрибутов при изменении команды"""
+        self._prepare_command(command)
+        return command
+
+    @validates('metric')
+    def _validate_metric(self, key, metric):
+        """Обновление единицы измерения для вывода"""
+        self.metric_str = metric or ""
+        return metric
+
+    def _prepare_command(self, command):
+        """Команда для поиска во фрейме и обработка значения параметра DR"""
+        # Фреймы разбираются в виде bytes, поэтому команда хранится в байтовом виде
+        self.command_bytes = command.encode('latin1') if command else None
+        is_dr = command == 'DR'
+        # Делитель значения (DR передается в десятых долях) и точность вывода
+        self.divisor = 10 if is_dr else 1
+        self.display_digits = 1 if is_dr else None
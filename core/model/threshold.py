@@ -16,11 +16,9 @@ class Threshold(Base):
 
     parameter = relationship(
         "Parameter",
-        back_populates="thresholds",
-        lazy="joined"
+        back_populates="thresholds"
     )
     device = relationship(
         "Device",
-        back_populates="thresholds",
-        lazy="joined"
+        back_populates="thresholds"
     )
@@ -0,0 +1,67 @@
+import asyncio
+import concurrent.futures
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from typing import Coroutine, Optional, Set
+
+try:
+    import uvloop
+except ImportError:  # uvloop недоступен (например, в Windows) - используем стандартный цикл событий
+    uvloop = None
+
+
+class AsyncEventLoopThread(Thread):
+    """Поток с собственным циклом событий asyncio, работающим до вызова stop()"""
+
+    def __init__(self, executor_workers: int = 4, name: str = "PollingServiceThread", cpu: Optional[int] = None):
+        super().__init__(daemon=True, name=name)
+        self.logger = logging.getLogger("AsyncEventLoopThread")
+        self.cpu = cpu  # Ядро процессора для потока цикла (None - без привязки)
+        self._original_affinity: Optional[Set[int]] = None  # Набор ядер до привязки потока цикла
+        self.loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        # Пул потоков для запросов к БД и записи файлов (asyncio.to_thread).
+        # Потоки пула создаются из привязанного потока цикла, поэтому initializer возвращает им все ядра
+        self.loop.set_default_executor(ThreadPoolExecutor(
+            max_workers=executor_workers, thread_name_prefix="polling-io", initializer=self._restore_affinity
+        ))
+
+    def run(self):
+        if self.cpu is not None:
+            self._pin_to_cpu(self.cpu)
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            # Дожидаемся завершения начатых в пуле потоков операций записи
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+            self.loop.close()
+
+    def _pin_to_cpu(self, cpu: int):
+        """Привязка текущего потока к ядру процессора (только Linux)"""
+        try:
+            self._original_affinity = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {cpu})  # 0 - вызывающий поток
+            self.logger.info("Поток %s привязан к ядру %d", self.name, cpu)
+        except AttributeError:
+            self.logger.warning("Привязка потока к ядру не поддерживается в этой ОС")
+        except OSError as e:
+            self.logger.warning("Не удалось привязать поток %s к ядру %d: %s", self.name, cpu, e)
+
+    def _restore_affinity(self):
+        """Снятие привязки к ядру цикла в потоке пула (выполняется при запуске потока пула)"""
+        if self._original_affinity is None:
+            return
+        try:
+            os.sched_setaffinity(0, self._original_affinity)
+        except OSError as e:
+            self.logger.warning("Не удалось восстановить набор ядер потока пула: %s", e)
+
+    def run_coroutine(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Запуск корутины в цикле потока (можно вызывать из любого потока)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        """Остановка цикла событий (можно вызывать из любого потока)"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
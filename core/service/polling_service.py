@@ -1,39 +1,119 @@
 import asyncio
+import contextlib
 import json
 import logging
+import math
 import os
 import re
+import socket
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from PySide6.QtCore import Signal, QObject
 
+try:
+    import orjson
+except ImportError:  # Без orjson используем стандартный json
+    orjson = None
+
 from core.model import Device, Parameter
 from infrastructure.db.postgres import PostgresDB
-from infrastructure.db.repositories import (
-    DeviceRepository,
-    ParameterRepository,
-    DeviceTypeRepository
-)
+from infrastructure.db.repositories import DeviceRepository
+
+# asyncio.timeout (Python 3.11+) не создает отдельную задачу на каждое ожидание, в отличие от wait_for
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+# Активные пороги устройства: ID параметра -> список пар (нижняя граница, верхняя граница)
+ThresholdMap = Dict[int, List[Tuple[float, float]]]
+
+
+async def _read_frame(reader: asyncio.StreamReader, timeout: float) -> bytes:
+    """Чтение одного фрейма устройства с таймаутом"""
+    if _asyncio_timeout is not None:
+        async with _asyncio_timeout(timeout):
+            return await reader.readuntil(b'\r\n')
+    return await asyncio.wait_for(reader.readuntil(b'\r\n'), timeout=timeout)
+
+
+def _dump_json_line(data: Dict[str, Any]) -> bytes:
+    """Сериализация данных в одну строку JSON (UTF-8, с переводом строки)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+
+def _write_files(batch: Dict[str, bytes]):
+    """Запись пакета файлов (выполняется вне цикла событий)"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for filename, payload in batch.items():
+        # Пишем во временный файл и подменяем целиком: GUI никогда не читает недописанный JSON
+        tmp_filename = filename + ".tmp"
+        fd = os.open(tmp_filename, flags, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        os.replace(tmp_filename, filename)
 
 
 class PollingService(QObject):
-    data_updated = Signal(str, dict, bool)  # Сигнал: имя устройства, данные, статус is_enable
+    # Сигнал за цикл: имя датчика (как у файла данных) -> (данные в формате файла, статус is_enable)
+    all_updated = Signal(dict)
+
+    WRITE_BATCH_SIZE = 64  # Максимум записей, обрабатываемых за одно обращение к пулу потоков
+    HISTORY_FILENAME = "history.ndjson"  # Журнал полученных данных (по строке на опрос), если включен
+    HISTORY_FSYNC_EVERY = 20  # Принудительный сброс журнала на диск каждые N пакетов
 
-    def __init__(self, db: PostgresDB, polling_interval: int = 15, output_dir: str = "device_data"):
+    def __init__(self, db: PostgresDB, polling_interval: int = 15, output_dir: str = "device_data",
+                 snapshot_every: int = 4, history_max_bytes: int = 0, history_backup_count: int = 3,
+                 max_concurrent_polls: int = 64, config_ttl: float = 60.0, connect_timeout: float = 5.0,
+                 read_timeout: float = 5.0, stream_frames: bool = False):
         super().__init__()
         self.db = db
         self._polling_interval = polling_interval
         self.output_dir = output_dir
-        self.device_repo = DeviceRepository(db.get_session())
-        self.device_type_repo = DeviceTypeRepository(db.get_session())
-        self.parameter_repo = ParameterRepository(db.get_session())
+        self.snapshot_every = snapshot_every  # Снимки состояния устройств пишутся раз в N циклов
+        # Размер файла журнала, после которого он ротируется (0 - журнал не ведется), и число архивных файлов
+        self.history_max_bytes = history_max_bytes
+        self.history_backup_count = history_backup_count
+        self.max_concurrent_polls = max_concurrent_polls  # Одновременно опрашиваемых устройств
+        self.connect_timeout = connect_timeout  # Таймаут установки соединения с устройством, сек.
+        self.read_timeout = read_timeout  # Таймаут ожидания фрейма от устройства, сек.
+        # Читать все фреймы по постоянному соединению вместо одного фрейма за цикл опроса
+        self.stream_frames = stream_frames
+        self.config_ttl = config_ttl  # Время жизни кэша устройств и параметров, сек.
         self.logger = logging.getLogger("PollingService")
         self.active_tasks: List[asyncio.Task] = []
         self._is_running = False
         self._polling_task: Optional[asyncio.Task] = None
         self._polling_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Цикл событий, в котором идет опрос
         self._tasks_lock = asyncio.Lock()  # Для синхронизации доступа к active_tasks
+        # Объединенные шаблоны фрейма: device_type_id -> (команды, набор команд, длины команд, шаблон)
+        self._frame_patterns: Dict[int, Tuple[Tuple[bytes, ...], frozenset, Tuple[int, ...], re.Pattern]] = {}
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._history_file = None
+        self._history_batches = 0
+        # Отложенные снимки: путь -> (строка JSON, значения параметров)
+        self._pending_snapshots: Dict[str, Tuple[bytes, Dict[str, Any]]] = {}
+        self._snapshot_values: Dict[str, Dict[str, Any]] = {}  # Значения в последнем успешно записанном снимке
+        self._cycle_count = 0
+        self._cycle_results: Dict[str, Tuple[Dict[str, Any], bool]] = {}  # Результаты текущего цикла
+        self._poll_semaphore: Optional[asyncio.Semaphore] = None
+        self._config_cache: Optional[List[Device]] = None
+        self._config_cache_ts = 0.0
+        # Активные пороги устройств, пересчитываются при обновлении кэша: ID устройства -> карта порогов
+        self._threshold_maps: Dict[int, ThresholdMap] = {}
+        # Файлы данных: ID устройства -> (имя устройства, имя датчика, путь)
+        self._path_cache: Dict[int, Tuple[str, str, str]] = {}
+        # Задачи непрерывного чтения: ID устройства -> ((ip, порт), задача) и актуальные данные устройств
+        self._stream_tasks: Dict[int, Tuple[Tuple[str, int], asyncio.Task]] = {}
+        self._stream_devices: Dict[int, Device] = {}
 
         os.makedirs(self.output_dir, exist_ok=True)
 
@@ -48,134 +128,520 @@ class PollingService(QObject):
         if value <= 0:
             raise ValueError("Интервал опроса должен быть положительным числом")
         self._polling_interval = value
-        if self._polling_event:
-            self._polling_event.set()
+        # Сеттер вызывается из потока GUI, а asyncio.Event не потокобезопасен -
+        # событие устанавливается в цикле опроса
+        loop, event = self._loop, self._polling_event
+        if loop is not None and event is not None:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Цикл событий уже закрыт - опрос остановлен
 
     async def get_all_devices_with_status(self) -> List[Device]:
-        """Получение всех устройств с их статусом"""
-        return self.device_repo.get_all_devices()
+        """Получение всех устройств с их статусом (с кэшированием на config_ttl секунд)"""
+        now = time.monotonic()
+        devices = self._config_cache
+        if devices is not None and now - self._config_cache_ts < self.config_ttl:
+            return devices
 
-    async def get_device_parameters(self, device: Device) -> List[Parameter]:
-        """Получение параметров устройства из БД"""
+        try:
+            devices = await asyncio.to_thread(self._load_devices)
+            self._threshold_maps = {device.id: self.build_threshold_map(device) for device in devices}
+        except Exception as e:
+            if self._config_cache is None:
+                raise
+            # БД временно недоступна - продолжаем опрос по последней известной конфигурации
+            self.logger.error("Ошибка обновления списка устройств, используется кэш: %s", e)
+            devices = self._config_cache
+
+        self._config_cache = devices
+        self._config_cache_ts = now
+        return devices
+
+    def _load_devices(self) -> List[Device]:
+        """Загрузка устройств со всеми нужными для опроса связями (выполняется вне цикла событий)"""
+        # Сессия закрывается сразу: все нужные связи загружены заранее,
+        # поэтому после закрытия сессии объекты остаются пригодными для опроса
+        with self.db.get_session() as session:
+            return DeviceRepository(session).get_all_for_polling()
+
+    def invalidate_config_cache(self):
+        """Сброс кэша устройств и параметров (после изменения настроек)"""
+        self._config_cache = None
+
+    def get_device_parameters(self, device: Device) -> List[Parameter]:
+        """Получение параметров устройства (загружены вместе с устройством)"""
         if not device.device_type_id:
-            self.logger.warning(f"Устройство {device.name} не имеет назначенного типа")
+            self.logger.warning("Устройство %s не имеет назначенного типа", device.name)
             return []
 
-        return self.parameter_repo.get_parameters_by_device_type(device.device_type_id)
+        return device.device_type.parameters
+
+    def _get_frame_pattern(self, device_type_id: int,
+                           parameters: List[Parameter]) -> Tuple[frozenset, Tuple[int, ...], re.Pattern]:
+        """Получение набора команд, их длин и объединенного шаблона для типа устройства"""
+        # Длинные команды ставим первыми, чтобы "TE" не перехватывалось командой "T"
+        commands = tuple(sorted({param.command_bytes for param in parameters}, key=lambda c: (-len(c), c)))
+        cached = self._frame_patterns.get(device_type_id)
+        if cached is None or cached[0] != commands:
+            alternation = b"|".join(re.escape(command) for command in commands)
+            lengths = tuple(sorted({len(command) for command in commands}, reverse=True))
+            pattern = re.compile(rb"(" + alternation + rb")\s*([+-]?\d+\.\d+)")
+            cached = (commands, frozenset(commands), lengths, pattern)
+            self._frame_patterns[device_type_id] = cached
+        return cached[1], cached[2], cached[3]
+
+    @staticmethod
+    def _parse_number(token: bytes) -> Optional[float]:
+        """Разбор числа вида ±nn.n (тот же формат, что и в шаблоне поиска)"""
+        integer, dot, fraction = token.partition(b'.')
+        if integer[:1] in (b'+', b'-'):
+            integer = integer[1:]
+        if dot and integer.isdigit() and fraction.isdigit():
+            return float(token)
+        return None
+
+    @classmethod
+    def _parse_frame_tokens(cls, frame: bytes, commands: frozenset, lengths: Tuple[int, ...]) -> Dict[bytes, float]:
+        """Разбор фрейма вида "CMD ±nn.n CMD ±nn.n ..." или "hh:mm:ss,dd.mm.yy,CMD±nn.n,..." без регулярных выражений"""
+        found: Dict[bytes, float] = {}
+        if b',' in frame:
+            # Поля через запятую, значение записано сразу после команды
+            for field in frame.split(b','):
+                field = field.strip()
+                for length in lengths:
+                    command = field[:length]
+                    if command in commands:
+                        if command not in found:
+                            value = cls._parse_number(field[length:].lstrip())
+                            if value is not None:
+                                found[command] = value
+                        break
+            return found
+
+        tokens = frame.split()
+        for index in range(len(tokens) - 1):
+            command = tokens[index]
+            if command in commands and command not in found:
+                value = cls._parse_number(tokens[index + 1])
+                if value is not None:
+                    found[command] = value
+        return found
+
+    def extract_frame_values(self, frame: bytes, device_type_id: int,
+                             parameters: List[Parameter]) -> Dict[int, float]:
+        """Извлечение значений всех параметров за один проход по фрейму"""
+        if not parameters:
+            return {}
+
+        try:
+            commands, lengths, pattern = self._get_frame_pattern(device_type_id, parameters)
+            found = self._parse_frame_tokens(frame, commands, lengths)
+            # Фрейм другого формата или часть команд не найдена - разбираем регулярным выражением,
+            # но только если недостающие команды вообще встречаются во фрейме
+            if len(found) < len(commands) and any(
+                    command in frame for command in commands if command not in found):
+                for match in pattern.finditer(frame):
+                    # Как и при поиске по отдельной команде, берем первое вхождение
+                    found.setdefault(match.group(1), float(match.group(2)))
+        except Exception as e:
+            self.logger.error("Ошибка разбора фрейма: %s", e)
+            return {}
+
+        values = {}
+        for param in parameters:
+            value = found.get(param.command_bytes)
+            if value is not None:
+                # Деление для параметра DR подготовлено при загрузке параметра
+                values[param.id] = value / param.divisor
+        return values
+
+    def _write_batch(self, snapshots: Dict[str, bytes], history: List[bytes]):
+        """Запись пакета данных (выполняется вне цикла событий)"""
+        if history:
+            # Журнал открывается один раз и дописывается одной операцией на пакет
+            if self._history_file is None:
+                self._history_file = open(os.path.join(self.output_dir, self.HISTORY_FILENAME), 'ab')
+            self._history_file.write(b"".join(history))
+            self._history_file.flush()
+            self._history_batches += 1
+            if self._history_file.tell() >= self.history_max_bytes:
+                self._rotate_history()
+            elif self._history_batches % self.HISTORY_FSYNC_EVERY == 0:
+                os.fsync(self._history_file.fileno())
+
+        if snapshots:
+            _write_files(snapshots)
+
+    def _rotate_history(self):
+        """Ротация журнала: history.ndjson -> history.ndjson.1 -> ... (старейший файл удаляется)"""
+        self._close_history()
+        base = os.path.join(self.output_dir, self.HISTORY_FILENAME)
+        if self.history_backup_count <= 0:
+            os.remove(base)
+            return
+        for index in range(self.history_backup_count - 1, 0, -1):
+            source = f"{base}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{base}.{index + 1}")
+        os.replace(base, f"{base}.1")
+
+    def _close_history(self):
+        """Закрытие файла журнала с принудительным сбросом на диск"""
+        if self._history_file is not None:
+            os.fsync(self._history_file.fileno())
+            self._history_file.close()
+            self._history_file = None
+
+    async def _writer_loop(self):
+        """Фоновая запись файлов: накопленные данные пишутся пакетом в пуле потоков"""
+        while True:
+            items = [await self._write_queue.get()]
+            while len(items) < self.WRITE_BATCH_SIZE and not self._write_queue.empty():
+                items.append(self._write_queue.get_nowait())
+
+            history = []
+            # Повторная запись того же файла в пакете заменяет предыдущую
+            snapshots = {}
+            for filename, payload, parameters_data, write_snapshot in items:
+                if self.history_max_bytes > 0:
+                    history.append(payload)
+                if write_snapshot:
+                    snapshots[filename] = (payload, parameters_data)
+                    self._pending_snapshots.pop(filename, None)
+                else:
+                    self._pending_snapshots[filename] = (payload, parameters_data)
+
+            try:
+                await self._write_snapshots(snapshots, history)
+                self.logger.debug("Записано файлов данных: %s, записей журнала: %s", len(snapshots), len(history))
+            except Exception as e:
+                self.logger.error("Ошибка записи данных устройств: %s", e)
+            finally:
+                for _ in items:
+                    self._write_queue.task_done()
 
-    async def extract_parameter_value(self, frame: str, parameter: Parameter) -> Optional[float]:
-        """Извлечение значения параметра из фрейма данных"""
+    async def _write_snapshots(self, snapshots: Dict[str, Tuple[bytes, Dict[str, Any]]], history: List[bytes]):
+        """Запись пакета в пуле потоков с учетом значений, попавших в файлы снимков"""
         try:
-            pattern = re.compile(fr"{re.escape(parameter.command)}\s*([+-]?\d+\.\d+)")
-            match = pattern.search(frame)
-            if not match:
-                return None
+            await asyncio.to_thread(
+                self._write_batch, {filename: payload for filename, (payload, _) in snapshots.items()}, history
+            )
+        except Exception:
+            # Содержимое файлов неизвестно - следующий снимок будет записан без сравнения значений
+            for filename in snapshots:
+                self._snapshot_values.pop(filename, None)
+            raise
+        for filename, (_, parameters_data) in snapshots.items():
+            self._snapshot_values[filename] = parameters_data
 
-            value = float(match.group(1))
+    def _start_writer(self):
+        """Запуск фоновой записи файлов в текущем цикле событий"""
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer_loop())
 
-            # Специальная обработка для параметра DR
-            if parameter.command == 'DR':
-                value = value / 10
-                self.logger.debug(f"Применено деление на 10 для параметра DR: {value}")
+    async def _stop_writer(self):
+        """Дозапись оставшихся данных и остановка фоновой записи"""
+        if self._writer_task is None:
+            return
 
-            return value
-        except Exception as e:
-            self.logger.error(f"Ошибка извлечения параметра {parameter.name}: {e}")
-            return None
+        cancelled = False
+        try:
+            await asyncio.wait_for(self._write_queue.join(), timeout=5.0)
+        except asyncio.TimeoutError:
+            self.logger.warning("Не все данные устройств были записаны при остановке")
+        except asyncio.CancelledError:
+            # Отмена передается вызывающему после освобождения ресурсов записи
+            self.logger.warning("Не все данные устройств были записаны при остановке")
+            cancelled = True
+        finally:
+            self._writer_task.cancel()
+            await asyncio.gather(self._writer_task, return_exceptions=True)
+            self._writer_task = None
+            self._write_queue = None
 
-    async def save_device_data(self, device: Device, parameters_data: List[Dict[str, Any]]):
-        """Сохранение данных устройства в JSON-файл"""
+        # Отложенные снимки состояния записываются при остановке
+        pending, self._pending_snapshots = self._pending_snapshots, {}
         try:
-            filename = f"{self.output_dir}/{device.name.replace(' ', '_')}.json"
-            data = {
-                "device_name": device.name,
-                "ip_address": device.ip_address,
-                "port": device.port,
-                "last_update": datetime.now().isoformat(),
-                "parameters": parameters_data
-            }
-
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            self.logger.debug(f"Данные устройства {device.name} сохранены в {filename}")
+            await self._write_snapshots(pending, [])
+            await asyncio.to_thread(self._close_history)
         except Exception as e:
-            self.logger.error(f"Ошибка сохранения данных устройства {device.name}: {e}")
+            self.logger.error("Ошибка записи данных устройств при остановке: %s", e)
+
+        if cancelled:
+            raise asyncio.CancelledError
+
+    def _get_device_paths(self, device: Device) -> Tuple[str, str]:
+        """Имя датчика и путь к файлу данных устройства (пересчитываются только при смене имени)"""
+        cached = self._path_cache.get(device.id)
+        if cached is None or cached[0] != device.name:
+            sensor_name = device.name.replace(' ', '_')
+            filename = os.path.join(self.output_dir, sensor_name + '.json')
+            cached = self._path_cache[device.id] = (device.name, sensor_name, filename)
+        return cached[1], cached[2]
+
+    @staticmethod
+    def _device_record(device: Device, parameters_data: Dict[str, Any],
+                       received_at: Optional[str] = None) -> Dict[str, Any]:
+        """Данные устройства в формате файла снимка"""
+        return {
+            "device_name": device.name,
+            "ip_address": device.ip_address,
+            "port": device.port,
+            "last_update": received_at or datetime.now().isoformat(),
+            "parameters": parameters_data
+        }
+
+    async def save_device_data(self, device: Device, data: Dict[str, Any]):
+        """Сохранение данных устройства: снимок состояния в JSON-файле и запись в журнал (если включен)
+
+        Снимок с неизменившимися значениями не переписывается, поэтому last_update в файле -
+        время получения значений, записанных в него последними; актуальное время приходит в сигнале all_updated.
+        """
+        try:
+            _, filename = self._get_device_paths(device)
+            parameters_data = data["parameters"]
+
+            # Одна строка JSON служит и записью журнала, и снимком состояния
+            payload = _dump_json_line(data)
+            # Первый снимок пишется сразу, далее - раз в snapshot_every циклов и только при изменении значений
+            written_values = self._snapshot_values.get(filename)
+            write_snapshot = written_values is None or (self._cycle_count % self.snapshot_every == 0
+                                                        and written_values != parameters_data)
+
+            # Значения снимка запоминаются только после успешной записи файла
+            if self._write_queue is not None:
+                await self._write_queue.put((filename, payload, parameters_data, write_snapshot))
+            else:
+                history = [payload] if self.history_max_bytes > 0 else []
+                await self._write_snapshots({filename: (payload, parameters_data)}, history)
+
+            self.logger.debug("Данные устройства %s поставлены в очередь записи %s", device.name, filename)
+        except Exception as e:
+            self.logger.error("Ошибка сохранения данных устройства %s: %s", device.name, e)
+
+    async def _open_connection(self, device: Device) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Установка соединения с устройством"""
+        # Устройство передает фреймы без запроса, поэтому соединение открывается на каждый опрос:
+        # в сохраненном между циклами соединении накапливались бы устаревшие фреймы
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(device.ip_address, device.port), timeout=self.connect_timeout
+        )
+        self._configure_socket(device, writer)
+        self.logger.debug("Подключено к %s (%s:%s)", device.name, device.ip_address, device.port)
+        return reader, writer
+
+    def _configure_socket(self, device: Device, writer: asyncio.StreamWriter):
+        """Настройка сокета устройства: без задержки Нейгла, с keepalive для непрерывного чтения"""
+        sock = writer.get_extra_info('socket')
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Обрыв долгого соединения в режиме непрерывного чтения обнаруживается ОС
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as e:
+            self.logger.debug("Не удалось настроить сокет %s: %s", device.name, e)
+
+    async def _close_connection(self, device_name: str, writer: asyncio.StreamWriter):
+        """Закрытие соединения с устройством"""
+        writer.close()
+        try:
+            await asyncio.wait_for(writer.wait_closed(), timeout=2.0)
+        except asyncio.TimeoutError:
+            self.logger.warning("Таймаут при закрытии соединения с %s", device_name)
+        except OSError as e:
+            self.logger.debug("Ошибка при закрытии соединения с %s: %s", device_name, e)
+
+    def _report_device(self, device: Device, data: Dict[str, Any], is_enabled: bool):
+        """Сохранение результата опроса для общего сигнала цикла (под тем же именем, что и файл данных)"""
+        self._cycle_results[self._get_device_paths(device)[0]] = (data, is_enabled)
 
     async def poll_device(self, device: Device):
         """Один цикл опроса устройства"""
+        async with self._poll_semaphore or contextlib.nullcontext():
+            await self._poll_device(device)
+
+    async def _poll_device(self, device: Device):
+        """Опрос устройства (вызывается в пределах ограничения параллельности)"""
         try:
             # Устанавливаем соединение
-            reader, writer = await asyncio.open_connection(device.ip_address, device.port)
-            self.logger.debug(f"Подключено к {device.name} ({device.ip_address}:{device.port})")
+            reader, writer = await self._open_connection(device)
 
             try:
                 # Читаем данные с таймаутом
-                data = await asyncio.wait_for(reader.readuntil(b'\r\n'), timeout=5.0)
-                frame_str = data.decode('latin1').strip()
-                self.logger.debug(f"Получены данные от {device.name}: {frame_str}")
-
-                # Получаем параметры
-                parameters = await self.get_device_parameters(device)
-                parameters_data = {}
-
-                for param in parameters:
-                    value = await self.extract_parameter_value(frame_str, param)
-                    if value is not None:
-                        formatted_value = float(f"{value:.1f}") if param.command == 'DR' else value
-                        parameters_data[param.name] = {
-                            "value": formatted_value,
-                            "metric": param.metric or ""
-                        }
-                        await self.check_thresholds(device, param, value)
-
-                # Отправляем данные через сигнал
-                self.data_updated.emit(device.name, parameters_data, True)
-                await self.save_device_data(device, parameters_data)
+                data = await _read_frame(reader, self.read_timeout)
+                await self._process_frame(device, data)
 
             except asyncio.TimeoutError:
-                self.logger.warning(f"Таймаут ожидания данных от {device.name}")
-                self.data_updated.emit(device.name, {}, True)
+                self.logger.warning("Таймаут ожидания данных от %s", device.name)
+                self._report_device(device, {"error": "Таймаут ожидания данных"}, False)
+            except asyncio.IncompleteReadError as e:
+                # Устройство закрыло соединение, не дослав конец фрейма
+                self.logger.warning("Соединение с %s закрыто устройством (получено %s байт без конца фрейма)",
+                                    device.name, len(e.partial))
+                self._report_device(device, {"error": "Соединение закрыто устройством"}, False)
+            except asyncio.LimitOverrunError as e:
+                # Разделитель фрейма не найден в пределах буфера чтения - поток не похож на протокол устройства
+                self.logger.error("Фрейм от %s превышает размер буфера чтения (%s байт)", device.name, e.consumed)
+                self._report_device(device, {"error": "Слишком длинный фрейм"}, False)
             except asyncio.CancelledError:
-                self.logger.debug(f"Опрос устройства {device.name} отменен")
+                self.logger.debug("Опрос устройства %s отменен", device.name)
                 raise
             except Exception as e:
-                self.logger.error(f"Ошибка при опросе устройства {device.name}: {e}")
-                self.data_updated.emit(device.name, {"error": str(e)}, False)
+                self.logger.error("Ошибка при опросе устройства %s: %s", device.name, e)
+                self._report_device(device, {"error": str(e)}, False)
             finally:
-                writer.close()
-                try:
-                    await asyncio.wait_for(writer.wait_closed(), timeout=2.0)
-                except asyncio.TimeoutError:
-                    self.logger.warning(f"Таймаут при закрытии соединения с {device.name}")
+                await self._close_connection(device.name, writer)
 
+        except (asyncio.TimeoutError, ConnectionRefusedError, OSError) as e:
+            self._report_unavailable(device, e)
         except Exception as e:
-            self.logger.error(f"Ошибка подключения к {device.name}: {e}")
-            self.data_updated.emit(device.name, {"error": str(e)}, False)
-
-    async def check_thresholds(self, device: Device, parameter: Parameter, value: float):
+            self.logger.error("Ошибка подключения к %s: %s", device.name, e)
+            self._report_device(device, {"error": str(e)}, False)
+
+    def _report_unavailable(self, device: Device, error: Exception):
+        """Сообщение о недоступности устройства (ошибка или таймаут подключения)"""
+        reason = str(error) or "таймаут подключения"
+        self.logger.warning("Устройство %s (%s:%s) недоступно: %s",
+                            device.name, device.ip_address, device.port, reason)
+        self._report_device(device, {"error": reason}, False)
+
+    async def _process_frame(self, device: Device, data: bytes):
+        """Разбор полученного фрейма, проверка порогов, отправка и сохранение данных"""
+        received_at = datetime.now().isoformat()  # Одна метка времени на весь фрейм
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Получены данные от %s: %s", device.name, data.decode('latin1').strip())
+
+        # Получаем параметры
+        parameters = self.get_device_parameters(device)
+        parameters_data = {}
+        values = self.extract_frame_values(data, device.device_type_id, parameters)
+        threshold_map = self._threshold_maps.get(device.id)
+        if threshold_map is None:
+            threshold_map = self.build_threshold_map(device)
+
+        for param in parameters:
+            value = values.get(param.id)
+            if value is not None:
+                formatted_value = round(value, param.display_digits) if param.display_digits else value
+                parameters_data[param.name] = {
+                    "value": formatted_value,
+                    "metric": param.metric_str
+                }
+                if param.id in threshold_map:
+                    self.check_thresholds(device, param, value, threshold_map)
+
+        # Отправляем данные через сигнал в том же виде, что и в файле снимка
+        record = self._device_record(device, parameters_data, received_at)
+        self._report_device(device, record, True)
+        await self.save_device_data(device, record)
+
+    async def _stream_device(self, device_id: int):
+        """Непрерывное чтение фреймов устройства по одному соединению (режим stream_frames)"""
+        while True:
+            # Конфигурация устройства берется актуальная: она обновляется при каждом цикле
+            device = self._stream_devices[device_id]
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(device.ip_address, device.port), timeout=self.connect_timeout
+                )
+            except (asyncio.TimeoutError, OSError) as e:
+                self._report_unavailable(device, e)
+                await asyncio.sleep(self.polling_interval)
+                continue
+
+            self._configure_socket(device, writer)
+            self.logger.debug("Подключено к %s (%s:%s), непрерывное чтение", device.name, device.ip_address, device.port)
+            try:
+                while True:
+                    data = await _read_frame(reader, self.read_timeout)
+                    device = self._stream_devices[device_id]
+                    await self._process_frame(device, data)
+            except asyncio.TimeoutError:
+                self.logger.warning("Таймаут ожидания данных от %s, переподключение", device.name)
+                self._report_device(device, {"error": "Таймаут ожидания данных"}, False)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error("Ошибка при чтении данных устройства %s: %s", device.name, e)
+                self._report_device(device, {"error": str(e)}, False)
+            finally:
+                await self._close_connection(device.name, writer)
+
+            # Пауза перед переподключением, чтобы не нагружать недоступное устройство
+            await asyncio.sleep(self.polling_interval)
+
+    async def _sync_stream_tasks(self, devices: List[Device]):
+        """Приведение задач непрерывного чтения в соответствие с текущим списком устройств"""
+        enabled = {device.id: device for device in devices if device.is_enable}
+        stale = []
+        for device_id, (address, task) in list(self._stream_tasks.items()):
+            device = enabled.get(device_id)
+            # Устройство отключено, удалено, сменило адрес или задача завершилась
+            if device is None or address != (device.ip_address, device.port) or task.done():
+                task.cancel()
+                stale.append(task)
+                del self._stream_tasks[device_id]
+        if stale:
+            await asyncio.gather(*stale, return_exceptions=True)
+
+        self._stream_devices = enabled
+        for device_id, device in enabled.items():
+            if device_id not in self._stream_tasks:
+                task = asyncio.create_task(self._stream_device(device_id))
+                self._stream_tasks[device_id] = ((device.ip_address, device.port), task)
+
+    async def _stop_stream_tasks(self):
+        """Остановка всех задач непрерывного чтения с закрытием соединений"""
+        tasks = [task for _, task in self._stream_tasks.values()]
+        self._stream_tasks = {}
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def build_threshold_map(device: Device) -> ThresholdMap:
+        """Активные пороги устройства, сгруппированные по ID параметра"""
+        threshold_map = {}
+        for threshold in device.thresholds:
+            if threshold.is_enable:
+                # Отсутствующая граница заменяется бесконечностью - проверка сводится к двум сравнениям
+                low_value = threshold.low_value if threshold.low_value is not None else -math.inf
+                high_value = threshold.high_value if threshold.high_value is not None else math.inf
+                threshold_map.setdefault(threshold.parameter_id, []).append((low_value, high_value))
+        return threshold_map
+
+    def check_thresholds(self, device: Device, parameter: Parameter, value: float,
+                         threshold_map: Optional[ThresholdMap] = None):
         """Проверка выхода значений за пороговые пределы"""
-        try:
-            for threshold in device.thresholds:
-                if threshold.parameter_id == parameter.id and threshold.is_enable:
-                    if threshold.low_value is not None and value < threshold.low_value:
-                        self.logger.warning(
-                            f"ПРЕДУПРЕЖДЕНИЕ: {device.name} {parameter.name} "
-                            f"({value}) ниже минимального порога ({threshold.low_value})"
-                        )
-                    if threshold.high_value is not None and value > threshold.high_value:
-                        self.logger.warning(
-                            f"ПРЕДУПРЕЖДЕНИЕ: {device.name} {parameter.name} "
-                            f"({value}) выше максимального порога ({threshold.high_value})"
-                        )
-        except Exception as e:
-            self.logger.error(f"Ошибка проверки порогов для {parameter.name}: {e}")
+        if threshold_map is None:
+            threshold_map = self.build_threshold_map(device)
+
+        for low_value, high_value in threshold_map.get(parameter.id, ()):
+            if value < low_value:
+                self.logger.warning(
+                    "ПРЕДУПРЕЖДЕНИЕ: %s %s (%s) ниже минимального порога (%s)",
+                    device.name, parameter.name, value, low_value
+                )
+            if value > high_value:
+                self.logger.warning(
+                    "ПРЕДУПРЕЖДЕНИЕ: %s %s (%s) выше максимального порога (%s)",
+                    device.name, parameter.name, value, high_value
+                )
 
     async def poll_all_devices(self):
         """Один цикл опроса всех устройств с учетом их статуса"""
+        self._cycle_count += 1
+        if self.stream_frames:
+            await self._stream_cycle()
+            return
+
+        self._cycle_results = {}
+        tasks: List[asyncio.Task] = []
         try:
             devices = await self.get_all_devices_with_status()
-            tasks = []
 
             for device in devices:
                 if device.is_enable:
@@ -184,16 +650,42 @@ class PollingService(QObject):
                     async with self._tasks_lock:
                         self.active_tasks.append(task)
                 else:
-                    self.data_updated.emit(device.name, {}, False)
+                    self._report_device(device, {}, False)
 
             if tasks:
                 await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Один сигнал на цикл вместо отдельного обновления GUI по каждому устройству
+            if self._cycle_results:
+                self.all_updated.emit(self._cycle_results)
         except Exception as e:
-            self.logger.error(f"Ошибка при опросе устройств: {e}")
+            self.logger.error("Ошибка при опросе устройств: %s", e)
         finally:
+            # Опросы не переживают свой цикл: при отмене цикла дожидаемся их завершения
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
             async with self._tasks_lock:
                 self.active_tasks = []
 
+    async def _stream_cycle(self):
+        """Цикл в режиме непрерывного чтения: обновление задач чтения и отправка накопленных данных"""
+        try:
+            devices = await self.get_all_devices_with_status()
+            await self._sync_stream_tasks(devices)
+            for device in devices:
+                if not device.is_enable:
+                    self._report_device(device, {}, False)
+        except Exception as e:
+            self.logger.error("Ошибка при обновлении задач чтения устройств: %s", e)
+
+        # Данные, полученные с прошлого цикла, отправляются одним сигналом
+        results, self._cycle_results = self._cycle_results, {}
+        if results:
+            self.all_updated.emit(results)
+
     async def run(self):
         """Запуск периодического опроса всех устройств"""
         if self._is_running:
@@ -208,30 +700,45 @@ class PollingService(QObject):
         self._polling_event = asyncio.Event()
         self._polling_event.clear()
         self._polling_task = asyncio.current_task()
+        self._poll_semaphore = asyncio.Semaphore(self.max_concurrent_polls)
+        self._start_writer()
 
+        loop = self._loop = asyncio.get_running_loop()
+        # Монотонное время не зависит от перевода системных часов
+        next_deadline = loop.time()
         try:
             while self._is_running:
-                start_time = datetime.now()
+                # Циклы идут по сетке с шагом polling_interval: задержки пробуждения не накапливаются
+                next_deadline += self.polling_interval
                 await self.poll_all_devices()
 
-                elapsed = (datetime.now() - start_time).total_seconds()
-                sleep_time = max(0, self.polling_interval - elapsed)
+                now = loop.time()
+                if now >= next_deadline:
+                    # Опрос не уложился в интервал - следующий цикл сразу, сетка сдвигается
+                    next_deadline = now
 
                 try:
-                    await asyncio.wait_for(self._polling_event.wait(), timeout=sleep_time)
+                    await asyncio.wait_for(self._polling_event.wait(), timeout=next_deadline - now)
                     self._polling_event.clear()
+                    # Интервал изменен - новый цикл начинается немедленно
+                    next_deadline = loop.time()
                 except asyncio.TimeoutError:
                     pass
 
         except asyncio.CancelledError:
             self.logger.info("Получен запрос на остановку опроса...")
         except Exception as e:
-            self.logger.error(f"Критическая ошибка в цикле опроса: {e}")
+            self.logger.error("Критическая ошибка в цикле опроса: %s", e)
             raise
         finally:
             self._is_running = False
-            self._polling_task = None
-            self.logger.info("Опрос полностью остановлен")
+            try:
+                await self._stop_stream_tasks()
+                await self._stop_writer()
+            finally:
+                self._polling_task = None
+                self._loop = None
+                self.logger.info("Опрос полностью остановлен")
 
     async def stop_polling(self):
         """Корректная остановка опроса"""
@@ -240,29 +747,27 @@ class PollingService(QObject):
 
         self._is_running = False
 
-        if self._polling_event:
+        if self._polling_event is not None:
             self._polling_event.set()
 
         async with self._tasks_lock:
-            current_tasks = list(self.active_tasks)
+            current_tasks = [task for task in self.active_tasks if not task.done()]
             self.active_tasks = []
 
+        # Отменяем опросы устройств и дожидаемся закрытия их соединений
+        for task in current_tasks:
+            task.cancel()
         if current_tasks:
-            try:
-                await asyncio.gather(*[task.cancel() for task in current_tasks if not task.done()],
-                                   return_exceptions=True)
-            except Exception as e:
-                self.logger.debug(f"Ошибка при отмене задач: {e}")
+            await asyncio.gather(*current_tasks, return_exceptions=True)
 
         if self._polling_task is not None and not self._polling_task.done():
             self._polling_task.cancel()
             try:
                 await self._polling_task
             except (asyncio.CancelledError, Exception) as e:
-                self.logger.debug(f"Ошибка при отмене основной задачи: {e}")
+                self.logger.debug("Ошибка при отмене основной задачи: %s", e)
 
     async def cleanup(self):
         """Очистка ресурсов"""
         await self.stop_polling()
-        if hasattr(self, '_polling_event') and self._polling_event is not None:
-            self._polling_event = None
\ No newline at end of file
+        self._polling_event = None
\ No newline at end of file
@@ -1,3 +1,6 @@
+import logging
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -6,6 +9,26 @@ class Settings(BaseSettings):
     DATABASE_URL: str = Field(..., env="DATABASE_URL")
     LOG_FILE: str = Field("reinhardt.log", env="LOG_FILE")
     LOG_LEVEL: str = Field("INFO", env="LOG_LEVEL")
+    # Ротация файла лога: размер файла в байтах и число архивных файлов
+    LOG_MAX_BYTES: int = Field(10 * 1024 * 1024, env="LOG_MAX_BYTES")
+    LOG_BACKUP_COUNT: int = Field(5, env="LOG_BACKUP_COUNT")
+    # Пул соединений с базой данных
+    DB_POOL_SIZE: int = Field(5, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(10, env="DB_MAX_OVERFLOW")
+    # Потоки для блокирующих операций сервиса опроса (запросы к БД, запись файлов)
+    THREAD_POOL_SIZE: int = Field(4, env="THREAD_POOL_SIZE")
+    # Ядро процессора для потока опроса (только Linux; не задано - без привязки)
+    POLLING_CPU: Optional[int] = Field(None, env="POLLING_CPU")
+    # Максимум одновременно опрашиваемых устройств
+    MAX_CONCURRENT_POLLS: int = Field(64, ge=1, env="MAX_CONCURRENT_POLLS")
+    # Снимки состояния устройств в device_data переписываются раз в N циклов опроса
+    SNAPSHOT_EVERY: int = Field(4, ge=1, env="SNAPSHOT_EVERY")
+    # Журнал всех полученных данных device_data/history.ndjson: размер файла до ротации
+    # в байтах (0 - журнал не ведется) и число архивных файлов
+    HISTORY_MAX_BYTES: int = Field(0, env="HISTORY_MAX_BYTES")
+    HISTORY_BACKUP_COUNT: int = Field(3, env="HISTORY_BACKUP_COUNT")
+    # Читать все фреймы по постоянному соединению (для устройств, передающих данные непрерывно)
+    STREAM_FRAMES: bool = Field(False, env="STREAM_FRAMES")
 
     class Config:
         # Путь к файлу .env
@@ -15,3 +38,6 @@ class Settings(BaseSettings):
 
 # Создаём экземпляр настроек
 settings = Settings()
+
+# Уровень логирования, вычисленный один раз из строкового значения настройки
+LOG_LEVEL_INT = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
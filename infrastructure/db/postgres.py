@@ -5,12 +5,24 @@ from core.model.base import Base  # Импортируем базовый кла
 
 
 class PostgresDB:
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, pool_size: int = 5, max_overflow: int = 10,
+                 pool_recycle: int = 1800):
         """
         Инициализация подключения к базе данных.
         :param database_url: Строка подключения к базе данных.
+        :param pool_size: Число постоянно открытых соединений в пуле.
+        :param max_overflow: Дополнительные соединения сверх pool_size при пиковой нагрузке.
+        :param pool_recycle: Время жизни соединения в пуле, сек.
         """
-        self.engine = create_engine(database_url, echo=False)  # echo=True для вывода SQL-запросов
+        self.engine = create_engine(
+            database_url,
+            echo=False,  # echo=True для вывода SQL-запросов
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,  # Проверка соединения перед выдачей из пула (после перезапуска БД)
+            pool_recycle=pool_recycle,
+            pool_use_lifo=True  # Первым выдается последнее возвращенное (самое "теплое") соединение
+        )
         self.Session = sessionmaker(bind=self.engine)
 
     def init_db(self):
@@ -33,9 +45,9 @@ class PostgresDB:
         """
         try:
             # Создаём сессию и выполняем запрос с использованием text()
-            session = self.get_session()
-            session.execute(text('SELECT 1'))  # Используем text() для SQL-запроса
-            session.commit()  # Подтверждаем транзакцию
+            with self.get_session() as session:
+                session.execute(text('SELECT 1'))  # Используем text() для SQL-запроса
+                session.commit()  # Подтверждаем транзакцию
             return True
         except Exception as e:
             # print(f"Ошибка подключения к базе данных: {e}")
@@ -1,8 +1,8 @@
 from typing import Type
 
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload, raiseload, load_only
 
-from core.model import Device, Threshold
+from core.model import Device, DeviceType, Parameter, Threshold
 from infrastructure.db.repositories.base_repository import BaseRepository
 
 
@@ -14,7 +14,7 @@ class DeviceRepository(BaseRepository):
         """Получение устройства по ID с предзагрузкой связанных данных"""
         return self.session.query(Device).options(
             joinedload(Device.device_type),
-            joinedload(Device.thresholds).joinedload(Threshold.parameter)
+            selectinload(Device.thresholds).joinedload(Threshold.parameter)
         ).filter(Device.id == device_id).first()
 
     def get_devices_by_is_enable_true(self) -> list[Device]:
@@ -34,5 +34,26 @@ class DeviceRepository(BaseRepository):
         """Получение всех устройств с предзагрузкой связанных данных"""
         return self.session.query(Device).options(
             joinedload(Device.device_type),
-            joinedload(Device.thresholds).joinedload(Threshold.parameter)
+            selectinload(Device.thresholds).joinedload(Threshold.parameter)
+        ).order_by(Device.name).all()
+
+    def get_all_for_polling(self) -> list[Device]:
+        """
+        Получение всех устройств для цикла опроса одним набором запросов:
+        тип устройства с параметрами и пороги загружаются заранее,
+        обращение к любой другой связи вызывает ошибку.
+        Загружаются только используемые при опросе столбцы.
+        """
+        return self.session.query(Device).options(
+            load_only(Device.name, Device.ip_address, Device.port, Device.is_enable, Device.device_type_id,
+                      raiseload=True),
+            selectinload(Device.device_type).options(
+                load_only(DeviceType.id, raiseload=True),
+                selectinload(DeviceType.parameters).load_only(
+                    Parameter.name, Parameter.command, Parameter.metric, Parameter.device_type_id,
+                    raiseload=True
+                )
+            ),
+            selectinload(Device.thresholds),
+            raiseload('*')
         ).order_by(Device.name).all()
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from core.model import DeviceType
 from infrastructure.db.repositories.base_repository import BaseRepository
@@ -14,8 +14,8 @@ class DeviceTypeRepository(BaseRepository):
             self.session
             .query(DeviceType)
             .options(
-                joinedload(DeviceType.parameters),
-                joinedload(DeviceType.devices)
+                selectinload(DeviceType.parameters),
+                selectinload(DeviceType.devices)
             )
             .filter(DeviceType.id == device_type_id)
             .first()
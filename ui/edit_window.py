@@ -1,66 +1,130 @@
+import logging
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QGroupBox, QComboBox,
-    QLineEdit, QTextEdit, QTableWidget, QTableWidgetItem,
-    QHBoxLayout, QPushButton
+    QLineEdit, QTextEdit, QTableView, QAbstractItemView,
+    QHBoxLayout, QPushButton, QStyledItemDelegate, QDoubleSpinBox
 )
 
 
+# Стиль диалога; применяется к приложению один раз при запуске, селекторы ограничены #EditDialog
+EDIT_QSS_PATH = Path(__file__).with_name("edit_dialog.qss")
+
+
+def load_edit_stylesheet() -> str:
+    """Чтение таблицы стилей диалога редактирования станции"""
+    return EDIT_QSS_PATH.read_text(encoding="utf-8")
+
+
+class RangeModel(QAbstractTableModel):
+    """Модель таблицы допустимых диапазонов параметров (имя, минимум, максимум)"""
+    HEADERS = ("Параметр", "Мин", "Макс")
+
+    def __init__(self, names: List[str], default_min: float = -50.0, default_max: float = 50.0, parent=None):
+        super().__init__(parent)
+        self._names = list(names)
+        self._mins = [default_min] * len(self._names)
+        self._maxs = [default_max] * len(self._names)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+
+        row, column = index.row(), index.column()
+        if column == 0:
+            return self._names[row]
+        value = self._mins[row] if column == 1 else self._maxs[row]
+        # Редактор получает число (см. RangeDelegate), в ячейке отображается строка без лишних нулей
+        return value if role == Qt.EditRole else self.format_value(value)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or index.column() == 0:
+            return False
+
+        try:
+            number = float(str(value).replace(",", "."))
+        except ValueError:
+            return False
+
+        if index.column() == 1:
+            self._mins[index.row()] = number
+        else:
+            self._maxs[index.row()] = number
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return flags | Qt.ItemIsEditable if index.column() > 0 else flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    @staticmethod
+    def format_value(value: float) -> str:
+        """Строка значения границы: до 3 знаков после запятой, без лишних нулей"""
+        return f"{value:.3f}".rstrip("0").rstrip(".")
+
+    def name(self, row: int) -> str:
+        """Название параметра в строке"""
+        return self._names[row]
+
+    def set_range(self, row: int, min_value: float, max_value: float):
+        """Установка диапазона для одной строки"""
+        self._mins[row] = min_value
+        self._maxs[row] = max_value
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 2))
+
+    def reset_ranges(self, min_value: float, max_value: float):
+        """Установка одинакового диапазона для всех строк"""
+        self._mins = [min_value] * len(self._names)
+        self._maxs = [max_value] * len(self._names)
+        if self._names:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self._names) - 1, 2))
+
+    def ranges(self) -> Iterator[Tuple[str, float, float]]:
+        """Диапазоны всех параметров"""
+        return zip(self._names, self._mins, self._maxs)
+
+
+class RangeDelegate(QStyledItemDelegate):
+    """Редактор границ диапазона: QDoubleSpinBox с широкими пределами"""
+    MIN_VALUE = -1e6
+    MAX_VALUE = 1e6
+    DECIMALS = 3
+
+    def createEditor(self, parent, option, index):
+        editor = QDoubleSpinBox(parent)
+        editor.setRange(self.MIN_VALUE, self.MAX_VALUE)
+        editor.setDecimals(self.DECIMALS)
+        editor.setFrame(False)
+        return editor
+
+
 class EditDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Редактирование станции")
         self.setMinimumWidth(500)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #F5F0FF;
-                font-family: Arial;
-                font-size: 11pt;
-            }
-            QGroupBox {
-                border: 2px solid #925FE2;
-                border-radius: 10px;
-                margin-top: 10px;
-            }
-            QGroupBox:title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                background-color: #925FE2;
-                color: white;
-                font-weight: bold;
-            }
-            QLineEdit, QTextEdit, QComboBox {
-                background-color: white;
-                border: 2px solid #925FE2;
-                border-radius: 5px;
-                padding: 4px;
-            }
-            QTableWidget {
-                background-color: white;
-                border: 2px solid #925FE2;
-                border-radius: 5px;
-            }
-            QHeaderView::section {
-                background-color: #925FE2;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton {
-                background-color: #925FE2;
-                color: white;
-                font-weight: bold;
-                border-radius: 5px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #7E4ED6;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #666666;
-            }
-        """)
+        self.setObjectName("EditDialog")  # Для селекторов таблицы стилей приложения
+        self.logger = logging.getLogger("EditDialog")
+        self._build_ui()
 
+    def _build_ui(self):
+        """Построение виджетов диалога (выполняется один раз)"""
         layout = QVBoxLayout(self)
 
         # Настройки станции
@@ -107,19 +171,17 @@ class EditDialog(QDialog):
         range_group = QGroupBox("Допустимые диапазоны параметров")
         range_layout = QVBoxLayout()
 
-        self.range_table = QTableWidget(0, 3)
-        self.range_table.setHorizontalHeaderLabels(["Параметр", "Мин", "Макс"])
+        parameters = ["Температура", "Влажность", "Давление", "Скорость ветра", "Направление", "CVF"]
+        self.range_model = RangeModel(parameters, parent=self)
+
+        self.range_table = QTableView()
+        self.range_table.setModel(self.range_model)
         self.range_table.verticalHeader().setVisible(False)
         self.range_table.horizontalHeader().setStretchLastSection(True)
-        self.range_table.setEditTriggers(QTableWidget.AllEditTriggers)
-
-        parameters = ["Температура", "Влажность", "Давление", "Скорость ветра", "Направление", "CVF"]
-        for param in parameters:
-            row = self.range_table.rowCount()
-            self.range_table.insertRow(row)
-            self.range_table.setItem(row, 0, QTableWidgetItem(param))
-            self.range_table.setItem(row, 1, QTableWidgetItem("-50"))
-            self.range_table.setItem(row, 2, QTableWidgetItem("50"))
+        self.range_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        self.range_delegate = RangeDelegate(self.range_table)
+        self.range_table.setItemDelegateForColumn(1, self.range_delegate)
+        self.range_table.setItemDelegateForColumn(2, self.range_delegate)
 
         range_layout.addWidget(self.range_table)
         range_group.setLayout(range_layout)
@@ -142,7 +204,14 @@ class EditDialog(QDialog):
 
         # Инициализация состояния формы
         self.current_station_id = None
-        self.on_station_selected(0)  # Выбираем "Новую станцию" по умолчанию
+        self.reset()
+
+    def reset(self):
+        """Сброс формы к состоянию "Новая станция" перед повторным показом"""
+        if self.station_selector.currentIndex() != 0:
+            self.station_selector.setCurrentIndex(0)  # Обработчик выбора сам очистит форму
+        else:
+            self.on_station_selected(0)
 
     def on_station_selected(self, index):
         """Обработчик выбора станции из списка"""
@@ -173,10 +242,7 @@ class EditDialog(QDialog):
         self.description.clear()
 
         # Сбрасываем таблицу диапазонов к значениям по умолчанию
-        parameters = ["Температура", "Влажность", "Давление", "Скорость ветра", "Направление", "CVF"]
-        for row in range(self.range_table.rowCount()):
-            self.range_table.item(row, 1).setText("-50")
-            self.range_table.item(row, 2).setText("50")
+        self.range_model.reset_ranges(-50.0, 50.0)
 
     def load_station_data(self, station_id):
         """Загрузка данных станции (заглушка для демонстрации)"""
@@ -204,38 +270,38 @@ class EditDialog(QDialog):
         self.description.setText(station_data["description"])
 
         # Устанавливаем тестовые диапазоны
-        for row in range(self.range_table.rowCount()):
-            param = self.range_table.item(row, 0).text()
-            min_val = "-40" if "Температура" in param else "0" if "Влажность" in param else "950" if "Давление" in param else "0"
-            max_val = "50" if "Температура" in param else "100" if "Влажность" in param else "1050" if "Давление" in param else "100"
+        for row in range(self.range_model.rowCount()):
+            param = self.range_model.name(row)
+            min_val = -40.0 if "Температура" in param else 0.0 if "Влажность" in param else 950.0 if "Давление" in param else 0.0
+            max_val = 50.0 if "Температура" in param else 100.0 if "Влажность" in param else 1050.0 if "Давление" in param else 100.0
 
-            self.range_table.item(row, 1).setText(min_val)
-            self.range_table.item(row, 2).setText(max_val)
+            self.range_model.set_range(row, min_val, max_val)
 
     def delete_station(self):
         if self.current_station_id is not None:
-            print(f"🗑️ Станция {self.existing_stations[self.current_station_id]} удалена")
+            self.logger.info("Станция %s удалена", self.existing_stations[self.current_station_id])
             # Здесь будет код удаления станции из БД
         else:
-            print("Невозможно удалить - станция не выбрана")
+            self.logger.warning("Невозможно удалить - станция не выбрана")
         self.accept()
 
     def save(self):
         if self.station_selector.currentIndex() == 0:
-            print("💾 Создана новая станция:")
+            header = "Создана новая станция:"
         else:
-            print(f"💾 Настройки станции {self.existing_stations[self.current_station_id]} сохранены:")
-
-        # Выводим данные станции
-        print(f"  Название: {self.station_name.text()}")
-        print(f"  Тип оборудования: {self.equipment_type.currentText()}")
-        print(f"  IP: {self.ip_address.text()}:{self.port.text()}")
-
-        # Выводим диапазоны
-        for row in range(self.range_table.rowCount()):
-            param = self.range_table.item(row, 0).text()
-            min_val = self.range_table.item(row, 1).text()
-            max_val = self.range_table.item(row, 2).text()
-            print(f"  {param}: от {min_val} до {max_val}")
+            header = f"Настройки станции {self.existing_stations[self.current_station_id]} сохранены:"
+
+        # Данные станции и диапазоны выводятся одной записью лога
+        lines = [
+            header,
+            f"  Название: {self.station_name.text()}",
+            f"  Тип оборудования: {self.equipment_type.currentText()}",
+            f"  IP: {self.ip_address.text()}:{self.port.text()}",
+        ]
+        lines.extend(
+            f"  {param}: от {RangeModel.format_value(min_val)} до {RangeModel.format_value(max_val)}"
+            for param, min_val, max_val in self.range_model.ranges()
+        )
+        self.logger.info("\n".join(lines))
 
         self.close()
\ No newline at end of file
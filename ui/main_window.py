@@ -1,19 +1,27 @@
+import fnmatch
 import json
 import logging
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from threading import Thread
-import asyncio
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QPalette, QColor
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont, QPalette, QColor, QTextCursor
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTableWidget, QTableWidgetItem, QLineEdit,
+    QPushButton, QTableView, QLineEdit,
     QTextEdit, QFrame, QMessageBox, QDialog
 )
 
 from ui.edit_window import EditDialog
 
+try:
+    import orjson
+except ImportError:  # Без orjson используем стандартный json
+    orjson = None
+
 # ==============================================
 # КОНСТАНТЫ ДЛЯ НАСТРОЙКИ ИНТЕРФЕЙСА
 # ==============================================
@@ -32,23 +40,138 @@ TITLE_BAR_HEIGHT = 40
 BUTTON_HEIGHT = 40
 TABLE_HEIGHT = 180
 LOG_HEIGHT = 220
+LOG_MAX_LINES = 1000  # Максимум строк в логе событий
+SENSOR_IO_WORKERS = 8  # Потоков для параллельного чтения файлов датчиков
+LOG_FLUSH_INTERVAL_MS = 100  # Период вывода накопленных сообщений лога
+STOP_CHECK_INTERVAL_MS = 100  # Период проверки завершения опроса после нажатия "Стоп"
+SENSOR_DATA_DIR = Path(__file__).parent.parent / "device_data"  # Файлы с последними данными датчиков
+SENSOR_FILE_PATTERN = "Reinhardt#*.json"  # Шаблон имен файлов датчиков
+
+
+# Таблица стилей главного окна: устанавливается для всего приложения один раз,
+# виджеты выбираются по objectName
+MAIN_WINDOW_QSS = f"""
+    QPushButton#titleButton {{
+        background-color: transparent;
+        color: {TEXT_COLOR};
+        font-size: 14px;
+        border: none;
+    }}
+    QPushButton#titleButton:hover {{
+        background-color: {SECONDARY_COLOR};
+    }}
+    QLabel#appTitle {{
+        color: {TEXT_COLOR};
+        font-weight: bold;
+    }}
+    QWidget#leftPanel {{
+        background-color: {BG_COLOR};
+    }}
+    QPushButton#menuButton {{
+        background-color: {MAIN_COLOR};
+        color: {TEXT_COLOR};
+        font-weight: bold;
+        border-radius: 5px;
+    }}
+    QPushButton#menuButton:hover {{
+        background-color: {SECONDARY_COLOR};
+    }}
+    QLabel#periodLabel {{
+        background-color: #F5F0FF;
+        color: {MAIN_COLOR};
+        border-radius: 8px;
+        padding: 6px 10px;
+    }}
+    QLineEdit#periodInput {{
+        background-color: #FFFFFF;
+        border: 2px solid {MAIN_COLOR};
+        border-radius: 5px;
+        padding: 5px;
+        font-weight: bold;
+    }}
+    QLineEdit#periodInput:focus {{
+        border-color: {SECONDARY_COLOR};
+    }}
+    QTableView#dataTable {{
+        border: 1px solid {MAIN_COLOR};
+    }}
+    #dataTable QHeaderView::section {{
+        background-color: {TABLE_HEADER_COLOR};
+        color: {TEXT_COLOR};
+        font-weight: bold;
+        padding: 5px;
+    }}
+    #dataTable QScrollBar:vertical {{
+        border: none;
+        background: {BG_COLOR};
+        width: 8px;
+        margin: 0px 0px 0px 0px;
+    }}
+    #dataTable QScrollBar::handle:vertical {{
+        background: {MAIN_COLOR};
+        min-height: 20px;
+        border-radius: 4px;
+    }}
+    #dataTable QScrollBar::add-line:vertical, #dataTable QScrollBar::sub-line:vertical {{
+        height: 0px;
+        background: none;
+    }}
+    #dataTable QScrollBar::add-page:vertical, #dataTable QScrollBar::sub-page:vertical {{
+        background: none;
+    }}
+    #dataTable QScrollBar:horizontal {{
+        border: none;
+        background: {BG_COLOR};
+        height: 8px;
+        margin: 0px 0px 0px 0px;
+    }}
+    #dataTable QScrollBar::handle:horizontal {{
+        background: {MAIN_COLOR};
+        min-width: 20px;
+        border-radius: 4px;
+    }}
+    #dataTable QScrollBar::add-line:horizontal, #dataTable QScrollBar::sub-line:horizontal {{
+        width: 0px;
+        background: none;
+    }}
+    #dataTable QScrollBar::add-page:horizontal, #dataTable QScrollBar::sub-page:horizontal {{
+        background: none;
+    }}
+    #logFrame, #logFrame * {{
+        background-color: {LOG_BG_COLOR};
+        border-radius: 15px;
+    }}
+    QTextEdit#eventLog {{
+        background-color: {LOG_TEXT_BG};
+        border: none;
+        font-family: Consolas, monospace;
+    }}
+    #eventLog QScrollBar:vertical {{
+        border: none;
+        background: {LOG_BG_COLOR};
+        width: 8px;
+        margin: 0px 0px 0px 0px;
+    }}
+    #eventLog QScrollBar::handle:vertical {{
+        background: {MAIN_COLOR};
+        min-height: 20px;
+        border-radius: 4px;
+    }}
+    #eventLog QScrollBar::add-line:vertical, #eventLog QScrollBar::sub-line:vertical {{
+        height: 0px;
+        background: none;
+    }}
+    #eventLog QScrollBar::add-page:vertical, #eventLog QScrollBar::sub-page:vertical {{
+        background: none;
+    }}
+"""
 
 
 def _create_title_button(text):
     """Создает кнопку для панели заголовка"""
     btn = QPushButton(text)
     btn.setFixedSize(30, 30)
-    btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: transparent;
-            color: {TEXT_COLOR};
-            font-size: 14px;
-            border: none;
-        }}
-        QPushButton:hover {{
-            background-color: {SECONDARY_COLOR};
-        }}
-    """)
+    btn.setObjectName("titleButton")
     return btn
 
 
@@ -69,7 +192,7 @@ class CustomTitleBar(QWidget):
 
         # Название приложения
         self.title = QLabel(APP_NAME)
-        self.title.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        self.title.setObjectName("appTitle")
         self.title.setFont(QFont("Arial", 12))
         layout.addWidget(self.title)
         layout.addStretch()
@@ -98,18 +221,136 @@ class CustomTitleBar(QWidget):
 
 
 class GUILogHandler(logging.Handler):
-    def __init__(self, log_signal):
+    def __init__(self, log_buffer: deque):
         super().__init__()
-        self.log_signal = log_signal
+        self.log_buffer = log_buffer  # Буфер строк лога, выводится в GUI по таймеру
 
     def emit(self, record):
-        log_entry = self.format(record)
-        self.log_signal.emit(log_entry)
+        self.log_buffer.append(self.format(record))
+
+
+class SensorTableModel(QAbstractTableModel):
+    """Модель таблицы текущих значений датчиков: строка на устройство"""
+    # Заголовок столбца и имя параметра в данных устройства (None - столбец имени датчика)
+    COLUMNS = (
+        ("Датчик", None),
+        ("Температура (°С)", "Temperature"),
+        ("Влажность (%)", "Humidity"),
+        ("Давление (kPa)", "Pressure"),
+        ("Скорость ветра (km/h)", "Wind speed"),
+        ("Направление (°)", "Wind direction"),
+        ("Коэф. охлаждения (°С)", "Cooling coefficient"),
+    )
+    # Имена параметров в порядке столбцов значений (вычисляются один раз)
+    PARAMETER_NAMES = tuple(parameter_name for _, parameter_name in COLUMNS[1:])
+    EMPTY_VALUE = "---"
+    ENABLED_COLOR = QColor(255, 255, 255)
+    DISABLED_COLOR = QColor(240, 240, 240)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[List[str]] = []
+        self._enabled: List[bool] = []
+        self._updated_at: List[str] = []  # Время получения (last_update) показанных значений
+        self._name_to_row: Dict[str, int] = {}  # Имя датчика -> номер строки
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole:
+            return self.ENABLED_COLOR if self._enabled[index.row()] else self.DISABLED_COLOR
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable if index.isValid() else Qt.NoItemFlags
+
+    def _add_rows(self, sensor_names: List[str]):
+        """Добавление строк для новых датчиков одной вставкой в конец таблицы"""
+        new_names = [name for name in dict.fromkeys(sensor_names) if name not in self._name_to_row]
+        if not new_names:
+            return
+
+        first_row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_names) - 1)
+        for row, sensor_name in enumerate(new_names, start=first_row):
+            self._rows.append([sensor_name] + [self.EMPTY_VALUE] * (len(self.COLUMNS) - 1))
+            self._enabled.append(True)
+            self._updated_at.append("")
+            self._name_to_row[sensor_name] = row
+        self.endInsertRows()
+
+    def update_sensors(self, updates: Dict[str, Tuple[dict, Optional[bool]]]):
+        """Обновление строк нескольких датчиков с одним сигналом dataChanged
+
+        Статус None (данные из файла) сохраняет текущий статус строки.
+        """
+        if not updates:
+            return
+
+        # Для отключенного устройства без строки в таблице новая строка не создается
+        self._add_rows([name for name, (_, is_enabled) in updates.items() if is_enabled is not False])
+        rows = []
+        for sensor_name, (data, is_enabled) in updates.items():
+            row = self._name_to_row.get(sensor_name)
+            if row is not None and self._apply(row, data, is_enabled):
+                rows.append(row)
+        if not rows:
+            return  # Данные не изменились - перерисовка не нужна
+
+        # Одно уведомление на диапазон затронутых строк вместо отдельного на каждую
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(self.COLUMNS) - 1))
+
+    def _apply(self, row: int, data: dict, is_enabled: Optional[bool]) -> bool:
+        """Запись данных датчика в строку модели (без уведомления); True - если строка изменилась"""
+        values = self._rows[row]
+        was_enabled = self._enabled[row]
+        if is_enabled is None:
+            is_enabled = was_enabled
+        self._enabled[row] = is_enabled
+
+        if not is_enabled:
+            # Заглушки записываются только при переходе в отключенное состояние
+            if was_enabled:
+                values[1:] = [self.EMPTY_VALUE] * (len(self.COLUMNS) - 1)
+            return was_enabled
+
+        new_values = values[1:]
+        updated_at = data.get("last_update") or ""
+        # Данные старше уже показанных (например, из отложенного снимка) пропускаются
+        if data.get("parameters") and updated_at >= self._updated_at[row]:
+            # Обновляем данные только для включенных устройств
+            self._updated_at[row] = updated_at
+            params = data["parameters"]
+            empty = self.EMPTY_VALUE
+            new_values = []
+            for parameter_name in self.PARAMETER_NAMES:
+                parameter = params.get(parameter_name)
+                new_values.append(str(parameter["value"]) if parameter and "value" in parameter else empty)
+        if new_values == values[1:] and was_enabled:
+            return False
+        values[1:] = new_values
+        return True
 
 
 class MeteoMonitor(QWidget):
     log_updated = Signal(str)
     update_triggered = Signal()  # Новый сигнал для обновления данных
+    sensors_loaded = Signal(dict)  # Результаты чтения файлов датчиков из пула потоков
 
     def __init__(self, app):
         super().__init__()
@@ -119,6 +360,19 @@ class MeteoMonitor(QWidget):
         self.old_pos = None
         self.is_polling_active = True
         self.update_timer = QTimer(self)  # Таймер для автоматического обновления
+        # Сообщения лога копятся в буфере (из любого потока) и выводятся пакетом по таймеру
+        self.log_buffer = deque(maxlen=LOG_MAX_LINES)
+        self.log_flush_timer = QTimer(self)
+        self.stop_check_timer = QTimer(self)  # Ожидание остановки опроса без блокировки GUI
+        self._edit_dialog: Optional[EditDialog] = None
+        self._sensor_files_cache: Optional[List[Path]] = None
+        self._sensor_names_cache: frozenset = frozenset()  # Имена датчиков из кэшированного списка файлов
+        # Имя датчика -> ((mtime_ns, размер) файла, разобранные данные)
+        self._json_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+        # Файлы датчиков читаются в пуле потоков; объекты Qt в рабочих потоках не используются
+        self._io_pool = ThreadPoolExecutor(max_workers=SENSOR_IO_WORKERS, thread_name_prefix="sensor-io")
+        self._sensors_loading = False
+        self._reload_requested = False
 
         # Инициализация UI
         self.init_ui()
@@ -126,6 +380,10 @@ class MeteoMonitor(QWidget):
         # Подключение сигналов
         self.log_updated.connect(self._add_log_message)
         self.update_triggered.connect(self.update_all_sensors)
+        self.sensors_loaded.connect(self._on_sensors_loaded)
+        self.log_flush_timer.timeout.connect(self._flush_log_buffer)
+        self.log_flush_timer.start(LOG_FLUSH_INTERVAL_MS)
+        self.stop_check_timer.timeout.connect(self._check_polling_stopped)
 
         # Настройка таймера обновления
         self.setup_update_timer()
@@ -180,7 +438,7 @@ class MeteoMonitor(QWidget):
     def init_left_panel(self, parent_layout):
         """Инициализация левой панели с кнопками"""
         left_panel = QWidget()
-        left_panel.setStyleSheet(f"background-color: {BG_COLOR};")
+        left_panel.setObjectName("leftPanel")
 
         layout = QVBoxLayout(left_panel)
         layout.setSpacing(15)
@@ -199,30 +457,12 @@ class MeteoMonitor(QWidget):
         lbl_period = QLabel("Период опроса")
         lbl_period.setAlignment(Qt.AlignCenter)
         lbl_period.setFont(QFont("Arial", 11, QFont.Bold))
-        lbl_period.setStyleSheet(f"""
-            QLabel {{
-                background-color: #F5F0FF;
-                color: {MAIN_COLOR};
-                border-radius: 8px;
-                padding: 6px 10px;
-            }}
-        """)
+        lbl_period.setObjectName("periodLabel")
 
         self.period_input = QLineEdit(str(self.app.polling_service.polling_interval))
         self.period_input.setAlignment(Qt.AlignCenter)
         self.period_input.setFixedHeight(30)
-        self.period_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: #FFFFFF;
-                border: 2px solid {MAIN_COLOR};
-                border-radius: 5px;
-                padding: 5px;
-                font-weight: bold;
-            }}
-            QLineEdit:focus {{
-                border-color: {SECONDARY_COLOR};
-            }}
-        """)
+        self.period_input.setObjectName("periodInput")
         self.period_input.returnPressed.connect(self.update_polling_period)
 
         # Добавление виджетов на панель
@@ -250,59 +490,10 @@ class MeteoMonitor(QWidget):
 
     def init_data_table(self, parent_layout):
         """Инициализация таблицы с данными датчиков"""
-        self.table = QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels([
-            "Датчик", "Температура (°С)", "Влажность (%)", "Давление (kPa)",
-            "Скорость ветра (km/h)", "Направление (°)", "Коэф. охлаждения (°С)"
-        ])
-        self.table.setStyleSheet(f"""
-                QTableWidget {{
-                    border: 1px solid {MAIN_COLOR};
-                }}
-                QHeaderView::section {{
-                    background-color: {TABLE_HEADER_COLOR};
-                    color: {TEXT_COLOR};
-                    font-weight: bold;
-                    padding: 5px;
-                }}
-                QScrollBar:vertical {{
-                    border: none;
-                    background: {BG_COLOR};
-                    width: 8px;
-                    margin: 0px 0px 0px 0px;
-                }}
-                QScrollBar::handle:vertical {{
-                    background: {MAIN_COLOR};
-                    min-height: 20px;
-                    border-radius: 4px;
-                }}
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                    height: 0px;
-                    background: none;
-                }}
-                QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                    background: none;
-                }}
-                QScrollBar:horizontal {{
-                    border: none;
-                    background: {BG_COLOR};
-                    height: 8px;
-                    margin: 0px 0px 0px 0px;
-                }}
-                QScrollBar::handle:horizontal {{
-                    background: {MAIN_COLOR};
-                    min-width: 20px;
-                    border-radius: 4px;
-                }}
-                QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                    width: 0px;
-                    background: none;
-                }}
-                QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-                    background: none;
-                }}
-            """)
-
+        self.sensor_model = SensorTableModel(self)
+        self.table = QTableView()
+        self.table.setObjectName("dataTable")  # До setModel: заголовок получает стиль при первом расчете размеров
+        self.table.setModel(self.sensor_model)
         self.table.setFixedHeight(TABLE_HEIGHT)
         self.table.verticalHeader().setVisible(False)
         parent_layout.addWidget(self.table)
@@ -311,10 +502,7 @@ class MeteoMonitor(QWidget):
         """Инициализация лога событий"""
         log_frame = QFrame()
         log_frame.setFixedHeight(LOG_HEIGHT)
-        log_frame.setStyleSheet(f"""
-            background-color: {LOG_BG_COLOR};
-            border-radius: 15px;
-        """)
+        log_frame.setObjectName("logFrame")
 
         log_layout = QVBoxLayout(log_frame)
         log_layout.setContentsMargins(10, 10, 10, 10)
@@ -324,31 +512,8 @@ class MeteoMonitor(QWidget):
 
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet(f"""
-                QTextEdit {{
-                    background-color: {LOG_TEXT_BG}; 
-                    border: none;
-                    font-family: Consolas, monospace;
-                }}
-                QScrollBar:vertical {{
-                    border: none;
-                    background: {LOG_BG_COLOR};
-                    width: 8px;
-                    margin: 0px 0px 0px 0px;
-                }}
-                QScrollBar::handle:vertical {{
-                    background: {MAIN_COLOR};
-                    min-height: 20px;
-                    border-radius: 4px;
-                }}
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                    height: 0px;
-                    background: none;
-                }}
-                QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                    background: none;
-                }}
-            """)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_LINES)  # Старые строки удаляются автоматически
+        self.log_text.setObjectName("eventLog")
 
         log_layout.addWidget(log_label)
         log_layout.addWidget(self.log_text)
@@ -358,10 +523,16 @@ class MeteoMonitor(QWidget):
     def open_edit_dialog(self):
         """Открывает диалоговое окно редактирования станций"""
         try:
-            dialog = EditDialog(self)
+            # Диалог создается при первом открытии и далее переиспользуется
+            if self._edit_dialog is None:
+                self._edit_dialog = EditDialog(self)
+            else:
+                self._edit_dialog.reset()
 
-            if dialog.exec() == QDialog.Accepted:
+            if self._edit_dialog.exec() == QDialog.Accepted:
                 self._add_log_message("Изменения в настройках станций сохранены")
+                self.app.polling_service.invalidate_config_cache()
+                self._invalidate_sensor_files()
                 self.update_all_sensors()
         except Exception as e:
             error_msg = f"Ошибка при открытии окна редактирования: {str(e)}"
@@ -372,84 +543,104 @@ class MeteoMonitor(QWidget):
         """Создает кнопку для меню"""
         btn = QPushButton(text)
         btn.setFixedHeight(BUTTON_HEIGHT)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {MAIN_COLOR};
-                color: {TEXT_COLOR};
-                font-weight: bold;
-                border-radius: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: {SECONDARY_COLOR};
-            }}
-        """)
+        btn.setObjectName("menuButton")
         return btn
 
     def load_sensor_data(self, sensor_name):
         """Загружает данные датчика из JSON-файла"""
         try:
-            file_path = Path(__file__).parent.parent / "device_data" / f"{sensor_name}.json"
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            file_path = SENSOR_DATA_DIR / f"{sensor_name}.json"
+            # Файл не изменился с прошлого чтения - возвращаем уже разобранные данные
+            stat = file_path.stat()
+            file_version = (stat.st_mtime_ns, stat.st_size)
+            cached = self._json_cache.get(sensor_name)
+            if cached is not None and cached[0] == file_version:
+                return cached[1]
+
+            raw = file_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self._json_cache[sensor_name] = (file_version, data)
+            return data
         except Exception as e:
+            self._json_cache.pop(sensor_name, None)
+            if isinstance(e, FileNotFoundError):
+                self._invalidate_sensor_files()  # Файл удален - список файлов устарел
             self.log_updated.emit(f"Ошибка загрузки данных датчика {sensor_name}: {str(e)}")
             return None
 
     def _get_sensor_files(self):
-        """Возвращает список файлов с данными датчиков"""
-        sensor_dir = Path(__file__).parent.parent / "device_data"
-        return list(sensor_dir.glob("Reinhardt#*.json"))
+        """Возвращает список файлов с данными датчиков (кэшируется до появления или удаления файла)"""
+        if self._sensor_files_cache is not None:
+            return self._sensor_files_cache
+
+        sensor_files = list(SENSOR_DATA_DIR.glob(SENSOR_FILE_PATTERN))
+        if SENSOR_DATA_DIR.is_dir():
+            # Каталог не отслеживается: файлы в нем подменяются почти каждый цикл опроса.
+            # Кэш сбрасывается при удалении файла, новом датчике в данных опроса и изменении настроек
+            self._sensor_files_cache = sensor_files
+            self._sensor_names_cache = frozenset(sensor_file.stem for sensor_file in sensor_files)
+        return sensor_files
+
+    def _invalidate_sensor_files(self):
+        """Сброс кэша списка файлов датчиков"""
+        self._sensor_files_cache = None
 
     def update_all_sensors(self):
         """Обновляет данные всех датчиков"""
-        sensor_files = self._get_sensor_files()
-        for sensor_file in sensor_files:
-            sensor_name = sensor_file.stem
-            data = self.load_sensor_data(sensor_name)
-            if data:
-                self.update_sensor_data(sensor_name, data, True)
-
-    def update_sensor_data(self, sensor_name: str, data: dict, is_enabled: bool):
-        """Обновление данных датчика в таблице"""
-        # Ищем датчик в таблице
-        row_found = -1
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0).text() == sensor_name:
-                row_found = row
-                break
-
-        # Если датчик не найден, добавляем новую строку
-        if row_found == -1:
-            row_found = self.table.rowCount()
-            self.table.insertRow(row_found)
-            self.table.setItem(row_found, 0, self._create_table_item(sensor_name))
-            for col in range(1, self.table.columnCount()):
-                self.table.setItem(row_found, col, self._create_table_item("---"))
-
-        # Устанавливаем стиль строки в зависимости от статуса
-        color = QColor(240, 240, 240) if not is_enabled else QColor(255, 255, 255)
-        for col in range(self.table.columnCount()):
-            item = self.table.item(row_found, col)
-            item.setBackground(color)
-
-            if not is_enabled and col > 0:
-                item.setText("---")
-
-        # Обновляем данные только для включенных устройств
-        if is_enabled and data.get("parameters"):
-            params = data["parameters"]
-            self.table.item(row_found, 1).setText(str(params.get("Temperature", {}).get("value", "---")))
-            self.table.item(row_found, 2).setText(str(params.get("Humidity", {}).get("value", "---")))
-            self.table.item(row_found, 3).setText(str(params.get("Pressure", {}).get("value", "---")))
-            self.table.item(row_found, 4).setText(str(params.get("Wind speed", {}).get("value", "---")))
-            self.table.item(row_found, 5).setText(str(params.get("Wind direction", {}).get("value", "---")))
-            self.table.item(row_found, 6).setText(str(params.get("Cooling coefficient", {}).get("value", "---")))
-
-    def _create_table_item(self, text):
-        """Создает элемент таблицы с выравниванием по центру"""
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignCenter)
-        return item
+        if self._sensors_loading:
+            # Предыдущее чтение еще идет - повторим после его завершения
+            self._reload_requested = True
+            return
+
+        sensor_names = [sensor_file.stem for sensor_file in self._get_sensor_files()]
+        if not sensor_names:
+            self.update_sensors_batch({})
+            return
+
+        # Файлы читаются параллельно, таблица обновляется одним пакетом после чтения всех
+        self._sensors_loading = True
+        updates = {}
+        pending = [len(sensor_names)]
+        lock = Lock()
+
+        def on_loaded(sensor_name: str, future: Future):
+            # Выполняется в рабочем потоке: только сбор результатов и испускание сигнала
+            data = None if future.cancelled() else future.result()
+            with lock:
+                if data:
+                    # Файл не содержит статуса устройства - статус строки задает сервис опроса
+                    updates[sensor_name] = (data, None)
+                pending[0] -= 1
+                finished = pending[0] == 0
+            if finished:
+                self.sensors_loaded.emit(updates)
+
+        for sensor_name in sensor_names:
+            future = self._io_pool.submit(self.load_sensor_data, sensor_name)
+            future.add_done_callback(lambda f, name=sensor_name: on_loaded(name, f))
+
+    def _on_sensors_loaded(self, updates: dict):
+        """Применение результатов чтения файлов датчиков в потоке GUI"""
+        self._sensors_loading = False
+        self.update_sensors_batch(updates)
+        if self._reload_requested:
+            self._reload_requested = False
+            self.update_all_sensors()
+
+    def shutdown_io_pool(self):
+        """Остановка пула потоков чтения файлов датчиков"""
+        self._io_pool.shutdown(wait=True, cancel_futures=True)
+
+    def update_sensors_batch(self, results: dict):
+        """Обновление таблицы по результатам всего цикла опроса за одну перерисовку"""
+        if self._sensor_files_cache is not None:
+            # Успешно опрошенный датчик, которого нет в списке файлов, - файл появился, список устарел
+            for sensor_name, (_, is_enabled) in results.items():
+                if (is_enabled and sensor_name not in self._sensor_names_cache
+                        and fnmatch.fnmatchcase(sensor_name + ".json", SENSOR_FILE_PATTERN)):
+                    self._invalidate_sensor_files()
+                    break
+        self.sensor_model.update_sensors(results)
 
     def update_polling_period(self):
         """Обновление периода опроса и интервала обновления"""
@@ -485,37 +676,36 @@ class MeteoMonitor(QWidget):
         if self.is_polling_active:
             try:
                 self.stop_auto_update()  # Останавливаем автообновление
-                Thread(
-                    target=self._async_stop_polling,
-                    daemon=True
-                ).start()
+                self.btn_stop.setEnabled(False)  # До завершения потока опроса
+                self.app.stop_polling_service()
+                self.stop_check_timer.start(STOP_CHECK_INTERVAL_MS)
             except Exception as e:
                 QMessageBox.critical(self, "Ошибка", f"Не удалось остановить опрос: {str(e)}")
 
-    def _async_stop_polling(self):
-        """Асинхронная остановка опроса (выполняется в отдельном потоке)"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.app.stop_polling_service())
-            # Обновляем кнопки в основном потоке
+    def _check_polling_stopped(self):
+        """Обновление кнопок после завершения потока опроса"""
+        if not self.app.is_polling_active():
+            self.stop_check_timer.stop()
             self.update_button_states(False)
-        except Exception as e:
-            self.log_updated.emit(f"Ошибка при остановке опроса: {str(e)}")
-        finally:
-            loop.close()
 
     def _add_log_message(self, message):
         """Добавление сообщения в лог"""
-        max_lines = 1000
-        if self.log_text.document().lineCount() > max_lines:
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(cursor.Start)
-            cursor.select(cursor.LineUnderCursor)
-            cursor.removeSelectedText()
-            cursor.deleteChar()
-
-        self.log_text.append(message)
+        self.log_buffer.append(message)
+
+    def _flush_log_buffer(self):
+        """Вывод накопленных сообщений лога одной вставкой"""
+        if not self.log_buffer:
+            return
+
+        messages = []
+        while self.log_buffer:
+            messages.append(self.log_buffer.popleft())
+
+        cursor = QTextCursor(self.log_text.document())
+        cursor.movePosition(QTextCursor.End)
+        if not self.log_text.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText("\n".join(messages))
         self.log_text.verticalScrollBar().setValue(self.log_text.verticalScrollBar().maximum())
 
     def mousePressEvent(self, event):